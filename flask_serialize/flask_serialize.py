@@ -1,10 +1,237 @@
 import ast
+import inspect
 import json
+import keyword
 from datetime import datetime, time
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from types import FunctionType
 from typing import Type, List
+from uuid import uuid4
+
+from flask import (
+    request,
+    jsonify,
+    abort,
+    current_app,
+    Response,
+    has_app_context,
+    has_request_context,
+    stream_with_context,
+)
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm.exc import UnmappedColumnError
+
+
+@lru_cache(maxsize=4096)
+def _fs_naive_to_date_short(d: datetime) -> str:
+    """
+    convert a naive datetime to a short date / time without fractional seconds.
+    cached as list results often share the same timestamps.  only naive values
+    are cached as aware values for the same instant compare and hash equal
+
+    :param d: {datetime.datetime} the naive value to convert
+    :return: {String} the short date
+    """
+    return d.isoformat(sep=" ", timespec="seconds")
+
 
-from flask import request, jsonify, abort, current_app, Response
-from permissive_dict import PermissiveDict
+def _fs_to_date_short(d: datetime) -> str:
+    """
+    convert the given date to a short date / time without fractional seconds.
+
+    :param d: {datetime.datetime} the value to convert
+    :return: {String} the short date
+    """
+    if isinstance(d, datetime) and d.tzinfo is None:
+        return _fs_naive_to_date_short(d)
+    return str(d).split(".")[0]
+
+
+@lru_cache(maxsize=None)
+def _fs_orjson_provider_class():
+    """
+    get the json provider class used by install_orjson
+
+    :return: OrjsonProvider or None when orjson is not installed
+    """
+    try:
+        from .json_provider import OrjsonProvider
+    except ImportError:
+        return None
+    return OrjsonProvider
+
+
+def _fs_orjson_installed() -> bool:
+    """
+    check if the json provider of the current app is the one set by install_orjson
+
+    :return: True if the app encodes json with OrjsonProvider
+    """
+    provider_class = _fs_orjson_provider_class()
+    return (
+        provider_class is not None
+        and has_app_context()
+        and isinstance(current_app.json, provider_class)
+    )
+
+
+def _fs_convert_error(e: Exception, name: str, c_type) -> str:
+    """
+    log and return the message used in place of a value that failed to convert
+
+    :param e: the conversion exception
+    :param name: field name
+    :param c_type: column type of the field
+    :return: the error message
+    """
+    message = 'Error:"{}". Failed to convert [{}] type:{}'.format(e, name, c_type)
+    current_app.logger.warning(message)
+    return message
+
+
+def _fs_compile_as_dict(field_list, exclude: frozenset, passthrough: bool = False):
+    """
+    generate a straight line as dict function for the fields, with the
+    field names and converters fixed, skipping any field names in exclude.
+    behaves as the loop in FlaskSerializeMixin._fs_as_dict without private fields
+
+    :param field_list: list of _FieldSpec
+    :param exclude: field names to leave out of the result
+    :param passthrough: leave DATETIME values as datetime
+    :return: function taking the model instance and returning a dict, or None when
+        a column attribute can not be used in generated code
+    """
+    namespace = {"_fs_convert_error": _fs_convert_error}
+    lines = ["def _fs_as_dict_fast(self):", "    d = {}"]
+    for index, f in enumerate(field_list):
+        name, converter, c_type = f.name, f.converter, f.c_type
+        if passthrough and converter is _fs_to_date_short:
+            converter = None
+        if name in exclude:
+            continue
+        key = repr(name)
+        if f.is_column and f.attr:
+            if not f.attr.isidentifier() or keyword.iskeyword(f.attr):
+                return None
+            lines.append(f"    v = self.{f.attr}")
+        else:
+            # property or relationship
+            lines += ["    try:", f"        v = getattr(self, {key}, '')"]
+            if converter:
+                lines += ["    except Exception as e:", "        v = str(e)"]
+            else:
+                lines += [
+                    "    except Exception:",
+                    "        pass",
+                    "    else:",
+                    f"        d[{key}] = '' if v is None else v",
+                ]
+                continue
+        if not converter:
+            lines.append(f"    d[{key}] = '' if v is None else v")
+            continue
+        namespace[f"conv_{index}"] = converter
+        namespace[f"c_type_{index}"] = c_type
+        call = f"conv_{index}(self, v)" if f.instance_converter else f"conv_{index}(v)"
+        lines += [
+            "    if v is None:",
+            f"        d[{key}] = ''",
+            "    else:",
+            "        try:",
+            f"            d[{key}] = {call}",
+            "        except Exception as e:",
+            f"            d[{key}] = _fs_convert_error(e, {key}, c_type_{index})",
+        ]
+    lines.append("    return d")
+    exec(compile("\n".join(lines), "<fs_as_dict>", "exec"), namespace)
+    return namespace["_fs_as_dict_fast"]
+
+
+# default for getattr to tell a missing attribute from a value
+_fs_missing = object()
+
+# model classes warned that __fs_datetime_passthrough__ needs install_orjson
+_fs_passthrough_warned = set()
+
+
+class _FieldSpec:
+    """
+    introspected details of a model field used for serialization and update
+    """
+
+    __slots__ = (
+        "name",
+        "c_type",
+        "converter",
+        "instance_converter",
+        "update_type",
+        "is_column",
+        "attr",
+    )
+
+    def __init__(
+        self,
+        name,
+        c_type="",
+        converter=None,
+        instance_converter=False,
+        update_type=None,
+        is_column=False,
+        attr=None,
+    ):
+        self.name = name
+        self.c_type = c_type
+        self.converter = converter
+        self.instance_converter = instance_converter
+        self.update_type = update_type
+        self.is_column = is_column
+        # mapped attribute name of a column, which can differ from the column name
+        self.attr = attr
+
+
+class _PropsSpec:
+    """
+    introspected details of a model class, cached on the class by _fs_props()
+    """
+
+    __slots__ = (
+        "name",
+        "primary_key_field",
+        "primary_key_attr",
+        "dialect",
+        "field_list",
+        "converters",
+        "convert_types",
+        "convert_methods",
+        "update_type_map",
+        "serializers",
+        "passthrough_serializers",
+        "excluded_json",
+        "update_properties",
+        "as_dict_fast",
+    )
+
+    def __init__(self, name, primary_key_field="id"):
+        self.name = name
+        self.primary_key_field = primary_key_field
+        # mapped attribute name of the primary key column
+        self.primary_key_attr = primary_key_field
+        self.dialect = None
+        self.field_list = []
+        self.converters = {}
+        self.convert_types = {}
+        # conversion methods by python type, filled as types are seen
+        self.convert_methods = {}
+        self.update_type_map = {}
+        self.serializers = ()
+        # serializers that leave DATETIME values as datetime
+        self.passthrough_serializers = ()
+        self.excluded_json = frozenset()
+        self.update_properties = frozenset()
+        # generated as dict functions by (excluded field names, passthrough),
+        # filled as they are used.  None when the function can not be generated
+        self.as_dict_fast = {}
 
 
 class FlaskSerializeNoDb(Exception):
@@ -45,18 +272,36 @@ class FlaskSerializeMixin:
         str(dict): lambda v: FlaskSerializeMixin.__fs_json_converter__(v),
     }
     __fs_convert_types_original__ = __fs_convert_types__.copy()
+    # leave DATETIME columns as datetime when serializing, when the app json provider
+    # is set by install_orjson, which encodes datetime values directly
+    __fs_datetime_passthrough__ = False
     # types that can be converted to json
     __fs_json_types = [str, dict, list, int, float, bool]
+    # column type prefixes mapped to the python type used when updating
+    __fs_update_type_prefixes = (
+        ("VARCHAR", str),
+        ("CHAR", str),
+        ("TEXT", str),
+        ("INTEGER", int),
+        ("FLOAT", float),
+        ("REAL", float),
+        ("NUMERIC", float),
+        ("DATE", datetime),
+        ("TIME", datetime),
+        ("BOOLEAN", bool),
+    )
     # default field name when restricting to a particular user
     __fs_user_field__ = "user"
+    # number of rows fetched at a time when streaming list results
+    __fs_yield_per__ = 500
+    # optional Flask-Caching Cache instance used by fs_json_get and fs_json_first
+    __fs_cache__ = None
+    # seconds to keep cached json responses
+    __fs_cache_timeout__ = 60
     # properties or fields to return when updating using get or post
     __fs_update_properties__ = []
     # db is required to be set for updating/deletion functions
     db = None
-    # cache model properties
-    __fs_model_props = {}
-    # previous values of an instance before update attempted
-    __fs_previous_field_value__ = {}
     # current version
     __fs_version__ = "2.1.1"
 
@@ -112,7 +357,7 @@ class FlaskSerializeMixin:
         :param d: {datetime.datetime} the value to convert
         :return: {String} the short date
         """
-        return str(d).split(".")[0]
+        return _fs_to_date_short(d)
 
     @classmethod
     def fs_query_by_access(cls, user=None, **kwargs) -> list:
@@ -123,6 +368,8 @@ class FlaskSerializeMixin:
         :param user: the user to use as a filter, default relationship name is user (__fs_user_field__)
         :return: a list of query results
         """
+        # __fs_can_access__() is checked in Python for each row.  When access can be
+        # expressed in SQL, use cls.query.filter_by() or filter() directly instead.
 
         if user:
             kwargs[cls.__fs_user_field__] = user
@@ -171,13 +418,74 @@ class FlaskSerializeMixin:
         :param item_id: {primary key} the primary key of the item to get
         :return: flask response with json item, or {} if not found or no access
         """
+        cache = cls.__fs_cache__
+        if cache is not None:
+            key = cls._fs_cache_key(item_id)
+            cached = cache.get(key)
+            if cached:
+                return Response(cached, mimetype="application/json")
+
         item = cls.query.get(item_id)
         if not item or not item.__fs_can_access__():
             return jsonify({})
-        return item.fs_as_json
+
+        response = item.fs_as_json
+        if cache is not None:
+            cache.set(key, response.get_data(), timeout=cls.__fs_cache_timeout__)
+        return response
+
+    @classmethod
+    def _fs_cache_key(cls, item_id) -> str:
+        """
+        return the __fs_cache__ key for the json of an item
+
+        :param item_id: {primary key} the primary key of the item
+        :return: str
+        """
+        return f"fs:{cls.__module__}.{cls.__qualname__}:{item_id}"
+
+    @classmethod
+    def __fs_cache_first_key(cls, kwargs) -> str:
+        """
+        return the __fs_cache__ key for the json of fs_json_first kwargs.  the key
+        includes a version that is changed whenever an item is written, so cached
+        first results are never stale
+
+        :param kwargs: filter_by arguments
+        :return: str or None when a kwarg value can not be used in a key
+        """
+        for value in kwargs.values():
+            # others, such as model instances, have no stable repr
+            if value is not None and not isinstance(value, (str, int, float)):
+                return None
+        version = cls.__fs_cache__.get(cls._fs_cache_key("first-version"))
+        if version is None:
+            version = cls.__fs_cache_new_first_version()
+        return cls._fs_cache_key(f"first:{version}:{sorted(kwargs.items())}")
 
     @classmethod
-    def fs_json_list(cls, query_result, prop_filters=None):
+    def __fs_cache_new_first_version(cls) -> str:
+        """
+        change the version of the cached fs_json_first results so all are replaced
+
+        :return: the new version
+        """
+        version = uuid4().hex
+        cls.__fs_cache__.set(cls._fs_cache_key("first-version"), version, timeout=0)
+        return version
+
+    def __fs_cache_delete(self):
+        """
+        remove any cached json for this item and all cached fs_json_first results
+        from __fs_cache__
+        """
+        if self.__fs_cache__ is not None:
+            item_id = getattr(self, type(self)._fs_props().primary_key_attr)
+            self.__fs_cache__.delete(self._fs_cache_key(item_id))
+            type(self).__fs_cache_new_first_version()
+
+    @classmethod
+    def fs_json_list(cls, query_result, prop_filters=None, stream: bool = False):
         """
         Return a list in json format from the query_result.
         When __fs_order_by_field__ is defined sort by that field in ascending order.
@@ -185,28 +493,38 @@ class FlaskSerializeMixin:
 
         :param query_result: sql alchemy query result
         :param prop_filters: dictionary of filter elements to restrict results
+        :param stream: fetch rows from the db in batches of __fs_yield_per__ and
+        stream the response when no sorting is required after serialization
         :return: flask response with json list of results
         """
-        items = [
+        # order in the db when possible so no sort is required
+        ordered = False
+        if hasattr(query_result, "order_by"):
+            query_result, ordered = cls.__fs_order_query(query_result)
+
+        if stream:
+            query_result = cls.__fs_stream_query(query_result)
+
+        items = (
             item.__fs_as_exclude_json_dict()
             for item in query_result
             if item.__fs_can_access__()
-        ]
-
-        if len(items) <= 0:
-            return jsonify(items)
+        )
 
         if prop_filters:
-            filtered_result = []
-            for item in items:
-                for k, v in prop_filters.items():
-                    if item.get(k) == v:
-                        filtered_result.append(item)
-                        break
-            items = filtered_result
+            items = cls.__fs_filter_items(items, prop_filters)
+
+        if ordered or (
+            not cls.__fs_order_by_field__ and not cls.__fs_order_by_field_desc__
+        ):
+            if stream and has_request_context():
+                # no sorting required so stream each item as it is serialized
+                body = stream_with_context(cls.__fs_stream_json_list(items))
+                return Response(body, mimetype="application/json")
+            items = list(items)
 
         # ascending
-        if cls.__fs_order_by_field__:
+        elif cls.__fs_order_by_field__:
             if callable(cls.__fs_order_by_field__):
                 items = sorted(
                     items,
@@ -215,35 +533,126 @@ class FlaskSerializeMixin:
             else:
                 items = sorted(
                     items,
-                    key=lambda i: i[cls._fs_get_field_name(cls.__fs_order_by_field__)],
+                    key=itemgetter(cls._fs_get_field_name(cls.__fs_order_by_field__)),
                 )
 
             # descending
         elif cls.__fs_order_by_field_desc__:
             items = sorted(
                 items,
-                key=lambda i: i[cls._fs_get_field_name(cls.__fs_order_by_field_desc__)],
+                key=itemgetter(cls._fs_get_field_name(cls.__fs_order_by_field_desc__)),
                 reverse=True,
             )
 
         return jsonify(items)
 
     @classmethod
-    def fs_dict_list(cls, query_result):
+    def __fs_order_query(cls, query):
+        """
+        order a query in the db by __fs_order_by_field__ or __fs_order_by_field_desc__
+        when the field is a column of the table
+
+        :param query: sql alchemy query
+        :return: tuple of the query and True if it was ordered
+        """
+        if cls.__fs_order_by_field__:
+            field, descending = cls.__fs_order_by_field__, False
+        elif cls.__fs_order_by_field_desc__:
+            field, descending = cls.__fs_order_by_field_desc__, True
+        else:
+            return query, False
+
+        if callable(field):
+            return query, False
+        column = cls.__table__.columns.get(cls._fs_get_field_name(field))
+        if column is None:
+            # properties and relationships are sorted after serialization
+            return query, False
+
+        # keep any existing ordering after the field so the field is the primary sort.
+        # when the existing ordering can not be read, sort after serialization
+        existing = getattr(query, "_order_by_clauses", None)
+        if existing is None:
+            return query, False
+        try:
+            return (
+                query.order_by(None).order_by(
+                    column.desc() if descending else column, *existing
+                ),
+                True,
+            )
+        except InvalidRequestError:
+            # limit or offset already applied
+            return query, False
+
+    @staticmethod
+    def __fs_filter_items(items, prop_filters):
+        """
+        yield only those items that match any of the prop_filters
+
+        :param items: iterable of dict items
+        :param prop_filters: dictionary of filter elements to restrict results
+        :return: generator of matching items
+        """
+        pf_items = tuple(prop_filters.items())
+        if len(pf_items) == 1:
+            ((k, v),) = pf_items
+            return (item for item in items if item.get(k) == v)
+        return (item for item in items if any(item.get(k) == v for k, v in pf_items))
+
+    @staticmethod
+    def __fs_stream_json_list(items):
+        """
+        yield a json list in chunks, one chunk per item, so a response
+        can be sent without holding the whole list in memory.  items are
+        encoded by the app json provider as jsonify does
+
+        :param items: iterable of dict items
+        :return: generator of str
+        """
+        dumps = current_app.json.dumps
+        yield "["
+        separator = ""
+        for item in items:
+            yield separator + dumps(item)
+            separator = ","
+        yield "]"
+
+    @classmethod
+    def fs_dict_list(cls, query_result, stream: bool = False):
         """
         return a list of dictionary objects from the sql query result
         without __fs_exclude_serialize_fields__ fields
         for only those than __fs_can_access__()
 
         :param query_result: sql alchemy query result
+        :param stream: fetch rows from the db in batches of __fs_yield_per__
         :return: list of dict objects
         """
+        if stream:
+            query_result = cls.__fs_stream_query(query_result)
+
         return [
             item.__fs_as_exclude_json_dict()
             for item in query_result
             if item.__fs_can_access__()
         ]
 
+    @classmethod
+    def __fs_stream_query(cls, query_result):
+        """
+        set a query to fetch rows in batches of __fs_yield_per__ using a server side
+        cursor where the db supports it.  Anything that is not a query is returned as is
+
+        :param query_result: sql alchemy query or query result
+        :return: the streaming query or query_result
+        """
+        if hasattr(query_result, "yield_per"):
+            return query_result.execution_options(stream_results=True).yield_per(
+                cls.__fs_yield_per__
+            )
+        return query_result
+
     @property
     def fs_as_json(self):
         """
@@ -270,11 +679,30 @@ class FlaskSerializeMixin:
 
         :return: dictionary
         """
-        return {
-            k: v
-            for k, v in self.fs_as_dict.items()
-            if k not in self.__fs_exclude_json_serialize_fields__
-        }
+        return self._fs_as_dict(_exclude=type(self)._fs_props().excluded_json)
+
+    def __fs_update_result(self):
+        """
+        private: get the dict used to serialize to web clients together with the
+        property values from the __fs_update_properties__ list, reading each
+        attribute once. used when returning success from a put/post update, ie:
+        {'message': 'Updated', 'item': item_dict, 'properties': properties}
+
+        :return: tuple of (item dictionary, properties dictionary)
+        """
+        props = type(self)._fs_props()
+        read = {}
+        item_dict = self._fs_as_dict(
+            _exclude=props.excluded_json,
+            _read_names=props.update_properties,
+            _read=read,
+        )
+        properties = {}
+        for prop in self.__fs_update_properties__:
+            # excluded or private names are not read while building the dict
+            value = read[prop] if prop in read else getattr(self, prop)
+            properties[prop] = self.__fs_property_converter__(value)
+        return item_dict, properties
 
     def __fs_property_converter__(self, value):
         """
@@ -327,8 +755,10 @@ class FlaskSerializeMixin:
         """
         if not value:
             return ""
-        value = value.decode()
-        return value
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        # bytearray / memoryview decode directly from the buffer without a copy
+        return str(value, "utf-8")
 
     @staticmethod
     def __fs_sqlite_from_str_json_converter(value):
@@ -377,110 +807,250 @@ class FlaskSerializeMixin:
         """
         if isinstance(value, datetime) or isinstance(value, time):
             return value
+        if not isinstance(value, str):
+            raise Exception(f"could not covert: {value} to datetime")
         # assumes ISO 8601 as per javascript standard for dates
-        for date_format in [
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M",
-            "%Y-%m-%d",
-        ]:
+        size = len(value)
+        if (
+            size in (10, 16, 19)
+            and value[4] == value[7] == "-"
+            and (
+                size == 10
+                or (
+                    value[10] in "T "
+                    and value[13] == ":"
+                    and (size == 16 or value[16] == ":")
+                )
+            )
+        ):
+            # exactly YYYY-MM-DD with optional THH:MM or THH:MM:SS, ' ' or 'T'
+            # separated, fromisoformat accepts other shapes strptime rejects
             try:
-                return datetime.strptime(value, date_format)
-            except:
+                return datetime.fromisoformat(value)
+            except ValueError:
                 pass
-        raise Exception(f"could not covert: {value} to datetime")
+        # pick the format from the shape of the value rather than trying each one
+        date_format = "%Y-%m-%d"
+        colons = value.count(":")
+        if colons:
+            separator = "T" if "T" in value else " "
+            date_format += separator + ("%H:%M:%S" if colons == 2 else "%H:%M")
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            raise Exception(f"could not covert: {value} to datetime") from None
 
-    def _fs_get_props(self):
+    @classmethod
+    def _fs_props(cls):
         """
-        get the properties for this table to be used for introspection
+        get the properties for this model class to be used for introspection.
+        introspection is done once per class and the result is cached on the class
+        itself so that subclasses get their own copy
 
-        :return: properties PermissiveDict
+        :return: properties _PropsSpec
         """
-        props = self.__fs_model_props.get(self.__table__)
-        if not props:
-            props = PermissiveDict(
-                name=self.__table__.name, id=0, primary_key_field="id"
+        props = cls.__dict__.get("_fs_cached_props")
+        if props is None:
+            props = cls.__fs_build_props()
+            setattr(cls, "_fs_cached_props", props)
+        return props
+
+    @classmethod
+    def __fs_build_props(cls):
+        """
+        introspect the table and class to build the properties used for serialization.
+        only uses class level information.  converters that are instance methods
+        are flagged with instance_converter so they can be called with the instance
+
+        :return: properties _PropsSpec
+        """
+        props = _PropsSpec(name=cls.__table__.name)
+        to_date_short = cls.__fs_to_date_short__
+        if to_date_short is FlaskSerializeMixin.__fs_to_date_short__:
+            # not overridden so no need to call through the instance
+            to_date_short = _fs_to_date_short
+        props.converters = {
+            "DATETIME": to_date_short,
+            "PROPERTY": cls.__fs_property_converter__,
+            "RELATIONSHIP": cls.__fs_relationship_converter,
+            "NUMERIC": float,
+            "DECIMAL": float,
+            "LOB": cls.__fs_lob_converter,
+            "BLOB": cls.__fs_lob_converter,
+            "CLOB": cls.__fs_lob_converter,
+        }
+        # only plain functions are called with the instance, overrides declared as
+        # staticmethod or classmethod are called with the value alone
+        instance_converters = [
+            getattr(cls, name)
+            for name in ("__fs_to_date_short__", "__fs_property_converter__")
+            if isinstance(inspect.getattr_static(cls, name), FunctionType)
+        ]
+
+        # SQL columns
+        exclude_fields = [
+            "fs_as_dict",
+            "fs_as_json",
+            "__fs_previous_field_value__",
+        ] + [cls._fs_get_field_name(f) for f in cls.__fs_exclude_serialize_fields__]
+        props.excluded_json = frozenset(exclude_fields) | frozenset(
+            cls._fs_get_field_name(f) for f in cls.__fs_exclude_json_serialize_fields__
+        )
+        props.update_properties = frozenset(cls.__fs_update_properties__)
+        columns = list(cls.__table__.columns)
+        # copy so the class attribute, which may be shared, is never changed
+        props.convert_types = dict(cls.__fs_convert_types__)
+        if "sqlite" in cls.__table__.dialect_options:
+            props.dialect = "sqlite"
+            props.convert_types[str(datetime)] = cls.__fs_sqlite_to_date_converter
+            props.convert_types[str(dict)] = cls.__fs_sqlite_to_dict_json_converter
+            props.converters["JSON"] = cls.__fs_sqlite_from_str_json_converter
+
+        for o, v in cls.__fs_convert_types_original__.items():
+            if o not in props.convert_types:
+                props.convert_types[o] = v
+
+        # detect primary field
+        for c in columns:
+            if c.primary_key:
+                props.primary_key_field = c.name
+                props.primary_key_attr = cls.__fs_column_attr(c) or c.name
+                break
+
+        # add custom converters
+        for converter, method in cls.__fs_column_type_converters__.items():
+            props.converters[converter] = method
+
+        # (name, c_type, python_type, is_column, attr) of columns, properties
+        # and relationships
+        field_list = [
+            (
+                c.name,
+                str(c.type).split("(")[0],
+                getattr(c.type, "python_type", None),
+                True,
+                cls.__fs_column_attr(c),
             )
-            props.converters = {
-                "DATETIME": self.__fs_to_date_short__,
-                "PROPERTY": self.__fs_property_converter__,
-                "RELATIONSHIP": self.__fs_relationship_converter,
-                "NUMERIC": float,
-                "DECIMAL": float,
-                "LOB": self.__fs_lob_converter,
-                "BLOB": self.__fs_lob_converter,
-                "CLOB": self.__fs_lob_converter,
-            }
-
-            # SQL columns
-            props.__exclude_fields = ["fs_as_dict", "fs_as_json",] + [
-                self._fs_get_field_name(f) for f in self.__fs_exclude_serialize_fields__
-            ]
-            field_list = list(self.__table__.columns)
-            if "sqlite" in self.__table__.dialect_options:
-                props.DIALECT = "sqlite"
-                self.__fs_convert_types__[
-                    str(datetime)
-                ] = self.__fs_sqlite_to_date_converter
-                self.__fs_convert_types__[
-                    str(dict)
-                ] = self.__fs_sqlite_to_dict_json_converter
-                props.converters["JSON"] = self.__fs_sqlite_from_str_json_converter
-
-            for o, v in self.__fs_convert_types_original__.items():
-                if o not in self.__fs_convert_types__:
-                    self.__fs_convert_types__[o] = v
-
-            # detect primary field
-            for f in field_list:
-                if f.primary_key:
-                    props.id = str(getattr(self, f.name, ""))
-                    props.primary_key_field = f.name
-                    break
-
-            # add class properties
-            field_list += [
-                PermissiveDict(name=p, type="PROPERTY")
-                for p in dir(self.__class__)
-                if isinstance(getattr(self.__class__, p), property)
-            ]
-            # add relationships
-            field_list += [
-                PermissiveDict(name=self._fs_get_field_name(p), type="RELATIONSHIP")
-                for p in self.__fs_relationship_fields__
-            ]
-            # add custom converters
-            for converter, method in self.__fs_column_type_converters__.items():
-                props.converters[converter] = method
-            # exclude fields / props
-            props.field_list = []
-            for f in field_list:
-                if f.name not in props.__exclude_fields:
-                    f.c_type = str(f.type).split("(")[0]
-                    f.converter = props.converters.get(f.c_type)
-                    if not f.converter:
-                        # any non json supported types gets a str
-                        if (
-                            getattr(f.type, "python_type", None)
-                            not in self.__fs_json_types
-                        ):
-                            f.converter = str
-                    props.field_list.append(f)
-
-            self.__fs_model_props[self.__table__] = props
+            for c in columns
+        ]
+        field_list += [
+            (p, "PROPERTY", None, False, None) for p in cls.__fs_class_properties()
+        ]
+        field_list += [
+            (cls._fs_get_field_name(p), "RELATIONSHIP", None, False, None)
+            for p in cls.__fs_relationship_fields__
+        ]
+        # exclude fields / props
+        for name, c_type, python_type, is_column, attr in field_list:
+            if name not in exclude_fields:
+                converter = props.converters.get(c_type)
+                if not converter:
+                    # any non json supported types gets a str
+                    if python_type not in cls.__fs_json_types:
+                        converter = str
+                props.field_list.append(
+                    _FieldSpec(
+                        name,
+                        c_type=c_type,
+                        converter=converter or None,
+                        instance_converter=converter in instance_converters,
+                        update_type=cls.__fs_update_type(c_type),
+                        is_column=is_column,
+                        attr=attr,
+                    )
+                )
+
+        # (name, getter, converter, instance_converter, c_type) used by fs_as_dict.
+        # properties, relationships and unmapped columns have no getter as they
+        # are read guarded
+        props.serializers = tuple(
+            (
+                f.name,
+                attrgetter(f.attr) if f.is_column and f.attr else None,
+                f.converter,
+                f.instance_converter,
+                f.c_type,
+            )
+            for f in props.field_list
+        )
+        # leave as datetime for the json encoder to convert
+        props.passthrough_serializers = tuple(
+            (name, getter, None, False, c_type)
+            if converter is _fs_to_date_short
+            else (name, getter, converter, instance_converter, c_type)
+            for name, getter, converter, instance_converter, c_type in props.serializers
+        )
+
+        # python type of each field for conversion when updating
+        for f in props.field_list:
+            if f.update_type:
+                props.update_type_map.setdefault(f.name, f.update_type)
+
         return props
 
-    def _fs_get_fields(self) -> List[str]:
+    @classmethod
+    def __fs_column_attr(cls, column):
+        """
+        get the name of the mapped attribute of a table column, which differs
+        from the column name when declared as ie: type_ = db.Column("type", ...)
+
+        :param column: table column
+        :return: attribute name or None when the column is not mapped
+        """
+        try:
+            return cls.__mapper__.get_property_by_column(column).key
+        except UnmappedColumnError:
+            return None
+
+    @classmethod
+    def __fs_class_properties(cls) -> List[str]:
+        """
+        get the names of the property attributes of the class by walking the
+        __dict__ of each class in the mro.  avoids getattr on every name from dir()
+        which walks the mro for each name and triggers other descriptors
+
+        :return: sorted list of property names
+        """
+        seen = set()
+        properties = []
+        for klass in cls.__mro__:
+            if klass is object:
+                break
+            for name, value in klass.__dict__.items():
+                if name in seen:
+                    continue
+                seen.add(name)
+                if isinstance(value, property):
+                    properties.append(name)
+        return sorted(properties)
+
+    @classmethod
+    def __fs_update_type(cls, c_type):
+        """
+        get the python type used to convert update values for a column type
+
+        :param c_type: the column type name
+        :return: class of the type or None
+        """
+        for prefix, update_type in cls.__fs_update_type_prefixes:
+            if c_type.startswith(prefix):
+                return update_type
+        if "JSON" in c_type:
+            return dict
+        if "LOB" in c_type:
+            return bytes
+        return None
+
+    def _fs_get_fields(self) -> List[_FieldSpec]:
         """
         return a list of field objects that are valid
         using __fs_private_field__
-        [{name,c__type,converter},...]
+        [_FieldSpec(name,c_type,converter,...),...]
 
-        :return: list of strings
+        :return: list of _FieldSpec
         """
         fields = []
-        for c in self._fs_get_props().field_list:
+        for c in type(self)._fs_props().field_list:
             if not self.__fs_private_field__(c.name):
                 fields.append(c)
         return fields
@@ -496,27 +1066,103 @@ class FlaskSerializeMixin:
         * __fs_column_type_converters__ - add additional sql column type converters to DATETIME, PROPERTY and RELATIONSHIP
         :return {dict} the item as a dict
         """
+        return self._fs_as_dict()
+
+    @classmethod
+    def __fs_passthrough_allowed(cls) -> bool:
+        """
+        check if DATETIME values can be left as datetime for the current app,
+        which is only when the app json provider is set by install_orjson.
+        checked for each call as apps can use different json providers
+
+        :return: True if datetime values are encoded by the json provider
+        """
+        if _fs_orjson_installed():
+            return True
+        if has_app_context() and cls not in _fs_passthrough_warned:
+            # other providers format datetime values differently
+            _fs_passthrough_warned.add(cls)
+            current_app.logger.warning(
+                f"{cls.__name__}: __fs_datetime_passthrough__ needs install_orjson"
+            )
+        return False
+
+    def _fs_as_dict(
+        self,
+        _exclude: frozenset = frozenset(),
+        _read_names: frozenset = frozenset(),
+        _read: dict = None,
+    ) -> dict:
+        """
+        convert to a dict in a single pass skipping any field names in _exclude
+
+        :param _exclude: field names to leave out of the result
+        :param _read_names: field names to also record the unconverted value of
+        :param _read: dict to record the unconverted values in
+        :return {dict} the item as a dict
+        """
 
         # built in converters
         # can be replaced using __fs_column_type_converters__
-        d = {}
+        props = type(self)._fs_props()
+        passthrough = (
+            self.__fs_datetime_passthrough__ and type(self).__fs_passthrough_allowed()
+        )
+        private_field = None
+        if (
+            type(self).__fs_private_field__
+            is not FlaskSerializeMixin.__fs_private_field__
+        ):
+            private_field = self.__fs_private_field__
+        elif not _read_names:
+            key = (_exclude, passthrough)
+            if key not in props.as_dict_fast:
+                props.as_dict_fast[key] = _fs_compile_as_dict(
+                    props.field_list, _exclude, passthrough
+                )
+            as_dict_fast = props.as_dict_fast[key]
+            if as_dict_fast:
+                return as_dict_fast(self)
 
-        for c in self._fs_get_fields():
-            try:
-                d[c.name] = v = getattr(self, c.name, "")
-            except Exception as e:
-                v = str(e)
+        serializers = (
+            props.passthrough_serializers if passthrough else props.serializers
+        )
+        d = {}
+        for name, getter, converter, instance_converter, c_type in serializers:
+            if name in _exclude or (private_field and private_field(name)):
+                continue
+            if getter:
+                # plain column
+                v = getter(self)
+                if name in _read_names:
+                    _read[name] = v
+            else:
+                # property or relationship
+                try:
+                    v = getattr(self, name, _fs_missing)
+                except Exception as e:
+                    v = str(e)
+                    if not converter:
+                        continue
+                else:
+                    if v is _fs_missing:
+                        # not recorded so the caller reads it again and raises
+                        v = ""
+                    elif name in _read_names:
+                        _read[name] = v
 
             if v is None:
-                d[c.name] = ""
-            elif c.converter:
+                d[name] = ""
+            elif not converter:
+                d[name] = v
+            else:
                 try:
-                    d[c.name] = c.converter(v)
+                    if instance_converter:
+                        d[name] = converter(self, v)
+                    else:
+                        d[name] = converter(v)
                 except Exception as e:
-                    d[c.name] = 'Error:"{}". Failed to convert [{}] type:{}'.format(
-                        e, c.name, c.c_type
-                    )
-                    current_app.logger.warning(d[c.name])
+                    d[name] = _fs_convert_error(e, name, c_type)
         return d
 
     def __fs_get_update_field_type(self, field, value):
@@ -527,34 +1173,7 @@ class FlaskSerializeMixin:
         :param value: unused
         :return: class of the type
         """
-        props = self._fs_get_props()
-        if props:
-            for f in props.field_list:
-                if f.name == field:
-                    if (
-                        f.c_type.startswith("VARCHAR")
-                        or f.c_type.startswith("CHAR")
-                        or f.c_type.startswith("TEXT")
-                    ):
-                        return str
-                    if f.c_type.startswith("INTEGER"):
-                        return int
-                    if (
-                        f.c_type.startswith("FLOAT")
-                        or f.c_type.startswith("REAL")
-                        or f.c_type.startswith("NUMERIC")
-                    ):
-                        return float
-                    if f.c_type.startswith("DATE") or f.c_type.startswith("TIME"):
-                        return datetime
-                    if f.c_type.startswith("BOOLEAN"):
-                        return bool
-                    if "JSON" in f.c_type:
-                        return dict
-                    if "LOB" in f.c_type:
-                        return bytes
-
-        return None
+        return type(self)._fs_props().update_type_map.get(field)
 
     def __fs_convert_value_to_db_suitable_value(self, name, value):
         """
@@ -568,20 +1187,33 @@ class FlaskSerializeMixin:
         :param value: value to update with
         :return: the converted value
         """
-        lookup_key = str(type(value))
-        if lookup_key in self.__fs_convert_types__:
-            value = self.__fs_convert_types__[lookup_key](value)
-            return value
-
-        instance_type = self.__fs_get_update_field_type(name, value)
-        if instance_type:
-            lookup_key = str(instance_type)
-            if lookup_key in self.__fs_convert_types__:
-                value = self.__fs_convert_types__[lookup_key](value)
-                return value
+        method = self.__fs_convert_method(type(value))
+        if method is None:
+            instance_type = self.__fs_get_update_field_type(name, value)
+            if instance_type:
+                method = self.__fs_convert_method(instance_type)
 
+        if method is not None:
+            return method(value)
         return value
 
+    @classmethod
+    def __fs_convert_method(cls, value_type):
+        """
+        get the __fs_convert_types__ method for a python type.  lookups are cached
+        by type so the str(type) key is only built once per type
+
+        :param value_type: the python type to look up
+        :return: the conversion method or None
+        """
+        props = cls._fs_props()
+        try:
+            return props.convert_methods[value_type]
+        except KeyError:
+            method = props.convert_types.get(str(value_type))
+            props.convert_methods[value_type] = method
+            return method
+
     @classmethod
     def _fs_get_field_name(cls, field) -> str:
         """
@@ -614,30 +1246,27 @@ class FlaskSerializeMixin:
             fs_create_fields = [
                 c.name
                 for c in new_item._fs_get_fields()
-                if isinstance(c, cls.db.Column)
-                and c.name != new_item._fs_get_props().primary_key_field
+                if c.is_column and c.name != cls._fs_props().primary_key_field
             ]
 
-        try:
-            json_data = request.get_json(force=True)
-        except:
-            json_data = request.form
-
-        if len(json_data) > 0:
-            for field in fs_create_fields:
-                field = cls._fs_get_field_name(field)
-                if field in json_data:
-                    value = json_data.get(field)
+        field_names = tuple(cls._fs_get_field_name(f) for f in fs_create_fields)
+        data = cls.__fs_request_data(request.form)
+        if data:
+            for name in field_names:
+                if name in data:
                     setattr(
                         new_item,
-                        field,
-                        new_item.__fs_convert_value_to_db_suitable_value(field, value),
+                        name,
+                        new_item.__fs_convert_value_to_db_suitable_value(
+                            name, data[name]
+                        ),
                     )
 
         new_item.__fs_verify__(create=True)
         new_item.__fs_update_timestamp__()
         cls.db.session.add(new_item)
         cls.db.session.commit()
+        new_item.__fs_cache_delete()
         new_item.__fs_after_commit__(create=True)
         return new_item
 
@@ -656,6 +1285,7 @@ class FlaskSerializeMixin:
             raise FlaskSerializeNoDb()
         self.db.session.add(self)
         self.db.session.commit()
+        self.__fs_cache_delete()
         self.__fs_after_commit__()
         return True
 
@@ -678,17 +1308,31 @@ class FlaskSerializeMixin:
 
         :return: True if item updated
         """
-
-        try:
-            json_data = request.get_json(force=True)
-        except Exception as e:
-            json_data = request.values
-            if len(json_data) == 0:
-                current_app.logger.exception(e)
-                return False
+        json_data = self.__fs_request_data(request.form)
+        if json_data is None or json_data is request.form:
+            # no json body so use the form and query string values
+            json_data = request.values or None
+        if json_data is None:
+            current_app.logger.warning("no json or form data to update from")
+            return False
 
         return self.__fs_request_update(json_data)
 
+    @staticmethod
+    def __fs_request_data(form_data):
+        """
+        get the json data of the current request.  json is parsed when the request
+        is json, or there is no form_data in case the content type is not set
+
+        :param form_data: the request form values to use when there is no json
+        :return: json data, form_data or None if there is neither
+        """
+        if request.is_json or not form_data:
+            json_data = request.get_json(force=True, silent=True)
+            if json_data is not None:
+                return json_data
+        return form_data or None
+
     def __fs_update_timestamp__(self):
         """
         update any timestamp fields using the Class timestamp method if those fields exist
@@ -698,10 +1342,29 @@ class FlaskSerializeMixin:
             if hasattr(self, field):
                 setattr(self, field, self.__fs_timestamp_stamper__())
 
+    @property
+    def __fs_previous_field_value__(self) -> dict:
+        """
+        previous values of this instance before an update is attempted,
+        stored per instance so that values are not shared between instances
+
+        :return: dict of field name to previous value
+        """
+        return self.__dict__.setdefault("__fs_previous_field_value__", {})
+
+    @__fs_previous_field_value__.setter
+    def __fs_previous_field_value__(self, value: dict) -> None:
+        """
+        replace the previous values of this instance, ie: to reset them with {}
+
+        :param value: dict of field name to previous value
+        """
+        self.__dict__["__fs_previous_field_value__"] = value
+
     def fs_update_from_dict(self, data_dict: dict) -> None:
         """
         uses a dict to update fields of the model instance.  sets previous values to
-        self.previous_values[field_name] before the update
+        self.__fs_previous_field_value__[field_name] before the update
 
         :param data_dict: the data to update
         :return:
@@ -712,19 +1375,17 @@ class FlaskSerializeMixin:
             __fs_update_fields__ = [
                 c.name
                 for c in self._fs_get_fields()
-                if isinstance(c, self.db.Column)
-                and c.name != self._fs_get_props().primary_key_field
+                if c.is_column and c.name != type(self)._fs_props().primary_key_field
             ]
-        for field in __fs_update_fields__:
-            field = self._fs_get_field_name(field)
-            self.__fs_previous_field_value__[field] = getattr(self, field)
-            if field in data_dict:
+        field_names = tuple(self._fs_get_field_name(f) for f in __fs_update_fields__)
+        previous_field_value = self.__fs_previous_field_value__
+        for name in field_names:
+            previous_field_value[name] = getattr(self, name)
+            if name in data_dict:
                 setattr(
                     self,
-                    field,
-                    self.__fs_convert_value_to_db_suitable_value(
-                        field, data_dict[field]
-                    ),
+                    name,
+                    self.__fs_convert_value_to_db_suitable_value(name, data_dict[name]),
                 )
 
     def __fs_can_access__(self):
@@ -767,22 +1428,6 @@ class FlaskSerializeMixin:
         """
         return True
 
-    def __fs_return_properties(self):
-        """
-        when returning success codes from a put/post update return a dict
-        composed of the property values from the __fs_update_properties__ list.
-        ie:
-        return jsonify({'message': 'Updated', 'properties': item.__return_properties()})
-        this can be used to communicate from the model on the server to the JavaScript code
-        interesting things from updates, by default returns all accessible fields / properties.
-
-        :return: dictionary of properties
-        """
-        return {
-            prop: self.__fs_property_converter__(getattr(self, prop))
-            for prop in self.__fs_update_properties__
-        }
-
     @classmethod
     def fs_get_delete_put_post(cls, item_id=None, user=None, prop_filters=None):
         """
@@ -809,7 +1454,7 @@ class FlaskSerializeMixin:
                 kwargs = {cls.__fs_user_field__: user}
                 result = cls.query.filter_by(**kwargs)
             else:
-                result = cls.query.all()
+                result = cls.query
             return cls.fs_json_list(result, prop_filters=prop_filters)
 
         try:
@@ -826,12 +1471,9 @@ class FlaskSerializeMixin:
                 # update single item with locked row
                 item = cls.query.with_for_update(of=cls).get_or_404(item_id)
                 if item.fs_request_update_form():
+                    item_dict, properties = item.__fs_update_result()
                     return jsonify(
-                        dict(
-                            message="Updated",
-                            item=item.__fs_as_exclude_json_dict(),
-                            properties=item.__fs_return_properties(),
-                        )
+                        dict(message="Updated", item=item_dict, properties=properties)
                     )
                 cls.db.session.rollback()
                 return Response("UPDATE forbidden", 403)
@@ -843,6 +1485,7 @@ class FlaskSerializeMixin:
                 if item.__fs_can_delete__():
                     cls.db.session.delete(item)
                     cls.db.session.commit()
+                    item.__fs_cache_delete()
                     return jsonify(dict(item=item.fs_as_dict, message="Deleted"))
                 return Response("DELETE forbidden", 403)
 
@@ -858,20 +1501,39 @@ class FlaskSerializeMixin:
         :param kwargs: SQLAlchemy query.filter_by arguments
         :return: flask response json item or {} if no result
         """
+        cache = cls.__fs_cache__
+        key = None
+        if cache is not None:
+            key = cls.__fs_cache_first_key(kwargs)
+            cached = key and cache.get(key)
+            if cached:
+                return Response(cached, mimetype="application/json")
+
         item = cls.query.filter_by(**kwargs).first()
         if not item or not item.__fs_can_access__():
             return jsonify({})
 
-        return item.fs_as_json
+        response = item.fs_as_json
+        if key is not None:
+            cache.set(key, response.get_data(), timeout=cls.__fs_cache_timeout__)
+        return response
+
+
+# mixin classes created by FlaskSerialize keyed by id(db)
+_mixin_cache = {}
 
 
 def FlaskSerialize(db=None) -> Type[FlaskSerializeMixin]:
     """
     Factory to
-    return the FlaskSerializeMixin mixin class, optionally initialize the db values
+    return a FlaskSerializeMixin mixin class for the db.  Each db gets its own
+    subclass with the db class value set, so FlaskSerializeMixin itself is not changed
 
     :param db: (optional) SQLAlchemy db instance
     :return: FlaskSerializeMixin mixin
     """
-    FlaskSerializeMixin.db = db
-    return FlaskSerializeMixin
+    mixin = _mixin_cache.get(id(db))
+    if mixin is None:
+        mixin = type("FlaskSerializeMixin", (FlaskSerializeMixin,), {"db": db})
+        _mixin_cache[id(db)] = mixin
+    return mixin
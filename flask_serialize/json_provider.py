@@ -0,0 +1,51 @@
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import orjson
+from flask.json.provider import JSONProvider
+
+
+def _fs_json_default(value):
+    """
+    convert values that orjson does not support natively.  naive datetimes are
+    treated as UTC, the same as orjson.OPT_NAIVE_UTC
+
+    :param value: value to convert
+    :return: json compatible value
+    """
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc).isoformat()
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask json provider that uses orjson for encoding and decoding.
+    orjson handles datetime, date, UUID and dataclasses natively.
+    naive datetimes are treated as UTC and non str dict keys are converted to str
+    """
+
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=_fs_json_default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def install_orjson(app):
+    """
+    use orjson for all jsonify responses of the Flask app, including those
+    of the FlaskSerializeMixin methods
+
+    :param app: the Flask app
+    :return: the installed provider
+    """
+    app.json = OrjsonProvider(app)
+    return app.json
@@ -53,5 +53,5 @@ setup(
     keywords="flask sqlalchemy serialize serialization serialise",
     packages=["flask_serialize"],
     include_package_data=True,
-    install_requires=["Permissive-Dict"],
+    extras_require={"orjson": ["orjson"]},
 )
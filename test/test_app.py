@@ -3,7 +3,8 @@ import random
 import string
 import time
 from http import HTTPStatus
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 from pathlib import Path
 from sqlalchemy import text, exc
 from sqlalchemy.exc import OperationalError
@@ -11,7 +12,22 @@ from sqlalchemy.exc import OperationalError
 import flask_unittest
 
 
-from test.test_flask_app import app, db, Setting, SubSetting, SimpleModel, DateTest
+from flask import Flask, jsonify
+from flask_serialize import FlaskSerialize, FlaskSerializeMixin
+from flask_serialize.flask_serialize import _fs_to_date_short
+from flask_serialize.json_provider import install_orjson, _fs_json_default
+from test.test_flask_app import (
+    app,
+    db,
+    Setting,
+    SubSetting,
+    SimpleModel,
+    DateTest,
+    BadModel,
+    RenamedColumn,
+    StaticConverter,
+    RenamedKey,
+)
 
 
 def random_string(length=20):
@@ -23,6 +39,18 @@ def random_string(length=20):
     return "".join(random.sample(string.ascii_letters, length))
 
 
+class DictCache(dict):
+    """
+    minimal stand in for a Flask-Caching Cache
+    """
+
+    def set(self, key, value, timeout=None):
+        self[key] = value
+
+    def delete(self, key):
+        self.pop(key, None)
+
+
 # =========================
 # TESTS
 # =========================
@@ -144,6 +172,79 @@ class TestAll(TestBase):
         assert len(fs_dict_list) == 1
         assert fs_dict_list[0]["key"] == key
 
+    def test_fs_json_list_streamed(self, app, client):
+        # add plenty
+        count = 5
+        for z in range(count):
+            self.add_setting(client, key=str(z), value=str(z + 1))
+
+        Setting.__fs_order_by_field__ = None
+        with app.test_request_context():
+            rv = Setting.fs_json_list(Setting.query, stream=True)
+            assert rv.is_streamed
+            json_settings = json.loads(rv.get_data())
+        assert len(json_settings) == count
+        assert {item["key"] for item in json_settings} == {str(z) for z in range(count)}
+        assert "updated" not in json_settings[0]
+        # empty list
+        with app.test_request_context():
+            rv = Setting.fs_json_list(
+                Setting.query.filter_by(key="not-here"), stream=True
+            )
+            assert json.loads(rv.get_data()) == []
+        # not streamed unless asked for
+        with app.test_request_context():
+            rv = Setting.fs_json_list(Setting.query)
+            assert not rv.is_streamed
+            assert len(rv.json) == count
+        # non str dict keys are encoded as jsonify does
+        with app.app_context():
+            db.session.add(SimpleModel(value="simple"))
+            db.session.commit()
+        with app.test_request_context():
+            rv = SimpleModel.fs_json_list(SimpleModel.query)
+            assert rv.json[0]["by_number"] == {"1": "simple"}
+            rv = SimpleModel.fs_json_list(SimpleModel.query, stream=True)
+            assert json.loads(rv.get_data())[0]["by_number"] == {"1": "simple"}
+        # ordered by the db so still streamed
+        Setting.__fs_order_by_field_desc__ = "value"
+        with app.test_request_context():
+            rv = Setting.fs_json_list(Setting.query, stream=True)
+            assert rv.is_streamed
+            json_settings = json.loads(rv.get_data())
+        values = [item["value"] for item in json_settings]
+        assert values == sorted(values, reverse=True)
+        Setting.__fs_order_by_field_desc__ = None
+
+        # sorted after serialization when the query ordering can not be read
+        class UnreadableOrder(list):
+            def order_by(self, *args):
+                raise AssertionError("not ordered in the db")
+
+        Setting.__fs_order_by_field_desc__ = "value"
+        with app.test_request_context():
+            rv = Setting.fs_json_list(UnreadableOrder(Setting.query.all()))
+        values = [item["value"] for item in rv.json]
+        assert values == sorted(values, reverse=True)
+        Setting.__fs_order_by_field_desc__ = None
+        # an already ordered query is still sorted by the field first
+        Setting.__fs_order_by_field__ = "value"
+        with app.test_request_context():
+            rv = Setting.fs_json_list(Setting.query.order_by(Setting.key.desc()))
+        values = [item["value"] for item in rv.json]
+        assert values == sorted(values)
+        Setting.__fs_order_by_field__ = None
+        # rows fetched in batches
+        Setting.__fs_yield_per__ = 2
+        try:
+            with app.test_request_context():
+                rv = Setting.fs_json_list(Setting.query, stream=True)
+                assert len(json.loads(rv.get_data())) == count
+            assert len(Setting.fs_dict_list(Setting.query, stream=True)) == count
+            assert len(Setting.fs_dict_list(Setting.query.all(), stream=True)) == count
+        finally:
+            Setting.__fs_yield_per__ = 500
+
     def test_get_user(self, app, client):
         key = random_string()
         # test add 2 settings
@@ -250,6 +351,16 @@ class TestAll(TestBase):
         assert 200 == rv.status_code
         assert 1 == len(rv.json)
         assert filter_key == rv.json[0]["key"]
+        # multiple filters match any
+        with app.app_context():
+            rv = Setting.fs_json_list(
+                Setting.query, prop_filters={"key": filter_key, "value": "not-here"}
+            )
+            assert 1 == len(rv.json)
+            rv = Setting.fs_json_list(
+                Setting.query, prop_filters={"key": filter_key, "setting_type": "test"}
+            )
+            assert 11 == len(rv.json)
 
     def test_private_field(self, app, client):
         # create
@@ -396,6 +507,9 @@ class TestAll(TestBase):
                 "/sub_setting_put/{}".format(ss_id), json=dict(boolean=new_boolean)
             )
             assert 200 == rv.status_code, rv
+            # column __fs_update_properties__ are returned
+            assert rv.json["properties"] == dict(flong=flong, boolean=new_boolean)
+            assert rv.json["item"]["boolean"] == new_boolean
             ss = SubSetting.query.get_or_404(ss_id)
             assert new_boolean == ss.boolean
 
@@ -445,6 +559,74 @@ class TestAll(TestBase):
         item = DateTest.query.first()
         # explicit double conversion type
         assert item.a_date == datetime.strptime(date_value, "%Y-%m-%d")
+        # date and time formats
+        for date_value, expected in [
+            ("2010-05-23T10:11", datetime(2010, 5, 23, 10, 11)),
+            ("2010-05-23 10:11:12", datetime(2010, 5, 23, 10, 11, 12)),
+            ("2010-5-3T1:02", datetime(2010, 5, 3, 1, 2)),
+        ]:
+            rv = client.put(f"/datetest/{item.id}", json=dict(a_date=date_value))
+            assert rv.status_code == 200, rv.data
+            assert DateTest.query.first().a_date == expected
+        # other ISO 8601 shapes are rejected as before
+        for date_value in ["not-a-date", "2010-05-23T10:11+01", "2010-W21-1"]:
+            rv = client.put(f"/datetest/{item.id}", json=dict(a_date=date_value))
+            assert rv.status_code == 400
+            message = f"could not covert: {date_value} to datetime"
+            assert message in rv.data.decode("utf-8")
+
+    def test_convert_types_not_changed_by_introspection(self, app, client):
+        mixin_convert_types = dict(FlaskSerializeMixin.__fs_convert_types__)
+        setting_convert_types = dict(Setting.__fs_convert_types__)
+        self.add_setting(client, key=random_string())
+        rv = client.post("/datetest", data=dict(a_date="2004-05-23"))
+        assert rv.status_code == 200, rv.data
+        assert mixin_convert_types == FlaskSerializeMixin.__fs_convert_types__
+        assert setting_convert_types == Setting.__fs_convert_types__
+
+    def test_fs_as_dict_generated(self, app, client):
+        with app.app_context():
+            item = SimpleModel(value="simple")
+            db.session.add(item)
+            db.session.commit()
+            # the generic loop is used when recording read values
+            generic = item._fs_as_dict(_read_names=frozenset(["id"]), _read={})
+            assert item.fs_as_dict == generic
+            assert SimpleModel._fs_props().as_dict_fast[(frozenset(), False)]
+            assert item.fs_as_dict == dict(
+                id=item.id, value="simple", prop="prop:simple", by_number={1: "simple"}
+            )
+            item.value = None
+            assert item.fs_as_dict["value"] == ""
+            # converter errors are returned in place of the value
+            bad_dict = BadModel(id=1, value="bad").fs_as_dict
+            assert bad_dict["value"].startswith('Error:"unsupported operand')
+            assert bad_dict["missing"] == ""
+            # update properties that fail to read raise rather than use the default
+            with self.assertRaises(AttributeError):
+                BadModel(id=1)._FlaskSerializeMixin__fs_update_result()
+
+    def test_renamed_column(self, app, client):
+        with app.app_context():
+            item = RenamedColumn(type_="kind")
+            db.session.add(item)
+            db.session.commit()
+            # output key is the column name, read from the mapped attribute
+            assert item.fs_as_dict == dict(id=item.id, type="kind")
+            generic = item._fs_as_dict(_read_names=frozenset(["id"]), _read={})
+            assert generic == item.fs_as_dict
+        with app.test_request_context():
+            rv = RenamedColumn.fs_json_list(RenamedColumn.query)
+            assert rv.json == [dict(id=1, type="kind")]
+
+    def test_static_and_class_method_converters(self, app, client):
+        with app.app_context():
+            item = StaticConverter(created=datetime(2020, 1, 2))
+            db.session.add(item)
+            db.session.commit()
+            assert item.fs_as_dict == dict(
+                id=item.id, created="StaticConverter:2020", prop=f"static:{item.id}"
+            )
 
     def test_excluded(self, app, client):
         # create
@@ -586,6 +768,26 @@ class TestAll(TestBase):
         assert item.scheduled.strftime(
             Setting.__fs_scheduled_date_format__
         ) == dt_now.strftime(Setting.__fs_scheduled_date_format__)
+        # json body without a json content type
+        key = random_string()
+        rv = client.post(
+            "/setting_post",
+            data=json.dumps(dict(setting_type="test", key=key, value=value)),
+        )
+        assert rv.status_code == 200, rv.data
+        assert rv.json["key"] == key
+        # json body is used before query string values
+        new_value = random_string()
+        rv = client.put(
+            f"/setting_put/{rv.json['id']}?value=from-query",
+            data=json.dumps(dict(value=new_value)),
+        )
+        assert rv.status_code == 200, rv.data
+        assert rv.json["item"]["value"] == new_value
+        # query string values when there is no body
+        rv = client.put(f"/setting_put/{rv.json['item']['id']}?value=from-query")
+        assert rv.status_code == 200, rv.data
+        assert rv.json["item"]["value"] == "from-query"
 
     def test_create_update_delete(self, app, client):
         # create
@@ -608,6 +810,15 @@ class TestAll(TestBase):
         new_value = random_string()
         item.fs_update_from_dict(dict(value=new_value))
         assert item.__fs_previous_field_value__["value"] == value
+        # previous values are per instance
+        assert Setting().__fs_previous_field_value__ == {}
+        assert "__fs_previous_field_value__" not in item.fs_as_dict
+        # can be reset per instance
+        other = Setting()
+        other.__fs_previous_field_value__ = dict(value="other")
+        item.__fs_previous_field_value__ = {}
+        assert item.__fs_previous_field_value__ == {}
+        assert other.__fs_previous_field_value__ == dict(value="other")
         assert item.value == new_value
         # set to new value
         new_value = random_string()
@@ -656,6 +867,77 @@ class TestAll(TestBase):
         assert 'FlaskSerializeMixin property "db" is not set' in rv.data.decode("utf-8")
         DateTest.db = old_db
 
+    def test_flask_serialize_factory(self, app, client):
+        other_db = object()
+        mixin = FlaskSerialize(db)
+        assert mixin is FlaskSerialize(db)
+        assert mixin.db is db
+        assert issubclass(mixin, FlaskSerializeMixin)
+        other_mixin = FlaskSerialize(other_db)
+        assert other_mixin is not mixin
+        assert other_mixin.db is other_db
+        assert mixin.db is db
+        assert FlaskSerializeMixin.db is db
+
+    def test_orjson_provider(self, app, client):
+        orjson_app = Flask("orjson_app")
+        provider = install_orjson(orjson_app)
+        assert orjson_app.json is provider
+        dt = datetime(2004, 5, 23, 10, 11, 12)
+        value = provider.dumps(dict(a=dt, b=Decimal("1.5"), c=[1, "two"]))
+        assert provider.loads(value) == dict(
+            a="2004-05-23T10:11:12+00:00", b="1.5", c=[1, "two"]
+        )
+        with orjson_app.app_context():
+            assert jsonify(dict(a=dt)).json == dict(a="2004-05-23T10:11:12+00:00")
+            assert jsonify({1: "a"}).json == {"1": "a"}
+        # the default function formats naive datetimes as orjson does
+        assert _fs_json_default(dt) == "2004-05-23T10:11:12+00:00"
+
+    def test_to_date_short_timezones(self, app, client):
+        utc = datetime(2020, 1, 1, 12, tzinfo=timezone.utc)
+        plus_one = datetime(2020, 1, 1, 13, tzinfo=timezone(timedelta(hours=1)))
+        # same instant so equal, but the output keeps each offset
+        assert utc == plus_one
+        assert _fs_to_date_short(utc) == "2020-01-01 12:00:00+00:00"
+        assert _fs_to_date_short(plus_one) == "2020-01-01 13:00:00+01:00"
+        assert _fs_to_date_short(datetime(2020, 1, 1, 12, 0, 1, 5)) == (
+            "2020-01-01 12:00:01"
+        )
+
+    def test_datetime_passthrough(self, app, client):
+        rv = client.post("/datetest", data=dict(a_date="2004-05-23"))
+        assert rv.status_code == 200, rv.data
+        assert rv.json["a_date"] == "2004-05-23 00:00:00"
+        item_id = rv.json["id"]
+        DateTest.__fs_datetime_passthrough__ = True
+        default_json = app.json
+        install_orjson(app)
+        try:
+            item = DateTest.query.first()
+            assert item.fs_as_dict["a_date"] == datetime(2004, 5, 23)
+            generic = item._fs_as_dict(_read_names=frozenset(["id"]), _read={})
+            assert generic["a_date"] == datetime(2004, 5, 23)
+            # the same format from all json responses
+            iso_date = "2004-05-23T00:00:00+00:00"
+            rv = client.put(f"/datetest/{item_id}", json=dict(a_date="2004-05-23"))
+            assert rv.json["item"]["a_date"] == iso_date
+            with app.test_request_context():
+                assert item.fs_as_json.json["a_date"] == iso_date
+                rv = DateTest.fs_json_list(DateTest.query)
+                assert rv.json[0]["a_date"] == iso_date
+                rv = DateTest.fs_json_list(DateTest.query, stream=True)
+                assert json.loads(rv.get_data())[0]["a_date"] == iso_date
+            # decided for each call, converted to a string when the app
+            # does not use install_orjson
+            app.json = default_json
+            assert item.fs_as_dict["a_date"] == "2004-05-23 00:00:00"
+            generic = item._fs_as_dict(_read_names=frozenset(["id"]), _read={})
+            assert generic["a_date"] == "2004-05-23 00:00:00"
+        finally:
+            app.json = default_json
+            DateTest.__fs_datetime_passthrough__ = False
+
     def test_form_page(self, app, client):
         # create
         key = random_string()
@@ -790,6 +1072,71 @@ class TestAll(TestBase):
                 == {}
             )
 
+    def test_fs_json_get_cache(self, app, client):
+        key = random_string()
+        test_value = random_string()
+        Setting.__fs_cache__ = cache = DictCache()
+        try:
+            item = self.add_setting(client, key=key, value=test_value)
+            rv = client.get(f"/setting_get_json/{item.id}")
+            assert rv.json["value"] == test_value
+            assert Setting._fs_cache_key(item.id) in cache
+            # changed directly in the db so cached value is returned
+            item.value = random_string()
+            db.session.commit()
+            rv = client.get(f"/setting_get_json/{item.id}")
+            assert rv.json["value"] == test_value
+            # not found is not cached
+            rv = client.get(f"/setting_get_json/{item.id + 100}")
+            assert rv.json == {}
+            assert Setting._fs_cache_key(item.id + 100) not in cache
+            # first
+            rv = client.get(f"/setting_fs_json_first/{key}")
+            assert rv.json["key"] == key
+            assert rv.json["value"] == test_value
+            # item and first results plus the first results version
+            assert len(cache) == 3
+            # update removes cached item and first results
+            new_value = random_string()
+            rv = client.put(f"/setting_put/{item.id}", json=dict(value=new_value))
+            assert rv.status_code == 200, rv.data
+            assert Setting._fs_cache_key(item.id) not in cache
+            rv = client.get(f"/setting_get_json/{item.id}")
+            assert rv.json["value"] == new_value
+            rv = client.get(f"/setting_fs_json_first/{key}")
+            assert rv.json["value"] == new_value
+            # values without a stable repr are not cached
+            cache_size = len(cache)
+            with app.test_request_context():
+                rv = Setting.fs_json_first(key=key, created=item.created)
+            assert rv.json["key"] == key
+            assert len(cache) == cache_size
+            # keys include the module so same named models do not share entries
+            assert Setting._fs_cache_key(1).startswith(
+                "fs:test.test_flask_app.Setting:"
+            )
+        finally:
+            Setting.__fs_cache__ = None
+
+    def test_cache_renamed_primary_key(self, app, client):
+        with app.app_context():
+            item = RenamedKey(value="old")
+            db.session.add(item)
+            db.session.commit()
+            item_id = item.key_id
+        RenamedKey.__fs_cache__ = cache = DictCache()
+        try:
+            with app.test_request_context():
+                rv = RenamedKey.fs_json_get(item_id)
+                assert rv.json["value"] == "old"
+                assert RenamedKey._fs_cache_key(item_id) in cache
+            with app.test_request_context(method="PUT", json=dict(value="new")):
+                item = RenamedKey.query.get(item_id)
+                assert item.fs_request_update_json()
+                assert RenamedKey._fs_cache_key(item_id) not in cache
+        finally:
+            RenamedKey.__fs_cache__ = None
+
     def test_get_0_is_not_null(self, app, client):
         key = random_string()
         with app.app_context():
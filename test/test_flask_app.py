@@ -514,14 +514,50 @@ class SimpleModel(fs_mixin, db.Model):
     def prop(self):
         return "prop:" + self.value
 
+    @property
+    def by_number(self):
+        return {1: self.value}
+
     def __repr__(self):
         return "<SimpleModel %r>" % (self.value)
 
 
+class RenamedColumn(fs_mixin, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    type_ = db.Column("type", db.String(30), default="kind")
+
+
+class StaticConverter(fs_mixin, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    created = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @property
+    def prop(self):
+        return self.id
+
+    @staticmethod
+    def __fs_property_converter__(value):
+        return f"static:{value}"
+
+    @classmethod
+    def __fs_to_date_short__(cls, date_value):
+        return f"{cls.__name__}:{date_value.year}"
+
+
+class RenamedKey(fs_mixin, db.Model):
+    key_id = db.Column("id", db.Integer, primary_key=True)
+    value = db.Column(db.String(30), default="")
+
+
 class BadModel(fs_mixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     value = db.Column(db.String(30), default="")
     __fs_column_type_converters__ = {"VARCHAR": lambda x: x / 0}
+    __fs_update_properties__ = ["missing"]
+
+    @property
+    def missing(self):
+        raise AttributeError("missing")
 
     def __repr__(self):
         return "<BadModel %r>" % (self.value)